@@ -6,29 +6,32 @@ creating accounts, performing transactions, and transfers.
 """
 
 from accounts import (
+    AccountRegistry,
     BankAccount,
     SavingsAccount,
     CreditAccount,
+    frozen_timestamp,
+    quiet_output,
     MAX_TRANSACTION_ATTEMPTS,
     MIN_SAVINGS_DEPOSIT,
     MIN_CREDIT_DEPOSIT
 )
-from input_utils import get_valid_input, find_account
-from database_manager import save_master_data
+from input_utils import emit, get_valid_input, find_account, read_line
 
 
-def create_account(accounts: list[BankAccount]) -> None:
+def create_account(accounts: AccountRegistry) -> None:
     """
     Create a new savings or credit account.
     
     Args:
-        accounts: List to append the new account to.
+        accounts: Registry to add the new account to.
     """
-    print("\n--- Open New Account ---")
-
     # Display account type options
-    print(f"1. Savings Account (Min Deposit: Rs. {MIN_SAVINGS_DEPOSIT:.0f})")
-    print(f"2. Credit Account  (Min Deposit: Rs. {MIN_CREDIT_DEPOSIT:.0f})")
+    emit(
+        "\n--- Open New Account ---",
+        f"1. Savings Account (Min Deposit: Rs. {MIN_SAVINGS_DEPOSIT:.0f})",
+        f"2. Credit Account  (Min Deposit: Rs. {MIN_CREDIT_DEPOSIT:.0f})"
+    )
     
     account_type = get_valid_input("Select Account Type (1 or 2): ", int)
     
@@ -37,7 +40,7 @@ def create_account(accounts: list[BankAccount]) -> None:
         return
 
     # Get holder name
-    holder_name = input("Enter Holder Name: ").strip()
+    holder_name = (read_line("Enter Holder Name: ") or "").strip()
     if not holder_name:
         print("❌ Holder name cannot be empty.")
         return
@@ -55,7 +58,7 @@ def create_account(accounts: list[BankAccount]) -> None:
 
     accounts.append(new_account)
     print(f"✅ Account Created Successfully! Number: {new_account.account_number}")
-    save_master_data(accounts)
+    accounts.mark_dirty(new_account)
 
 
 def _create_account_by_type(
@@ -89,19 +92,26 @@ def _create_account_by_type(
     return None
 
 
-def perform_transaction(accounts: list[BankAccount], transaction_type: str) -> None:
+def perform_transaction(accounts: AccountRegistry, transaction_type: str) -> None:
     """
     Perform a deposit or withdrawal transaction.
     
     Args:
-        accounts: List of all accounts.
+        accounts: Registry of all accounts.
         transaction_type: Either "deposit" or "withdraw".
     """
+    if transaction_type not in ("deposit", "withdraw"):
+        print("❌ Unknown transaction type.")
+        return
+
     account = find_account(accounts)
     if account is None:
         return
 
-    print(f"Current Balance: Rs. {account.get_balance():.2f}")
+    # Resolve the account method once instead of on every attempt
+    operation = account.deposit if transaction_type == "deposit" else account.withdraw
+
+    print(f"Current Balance: Rs. {account._balance_str}")
 
     for attempt in range(1, MAX_TRANSACTION_ATTEMPTS + 1):
         amount = get_valid_input(f"Enter amount to {transaction_type}: ", float)
@@ -112,40 +122,13 @@ def perform_transaction(accounts: list[BankAccount], transaction_type: str) -> N
                 return
             continue
 
-        success = _execute_transaction(account, transaction_type, amount)
-
-        if success:
-            save_master_data(accounts)
+        if operation(amount):
+            accounts.mark_dirty(account)
             return
 
         _handle_failed_attempt(attempt, "Transaction failed")
         if attempt < MAX_TRANSACTION_ATTEMPTS:
-            print(f"Current Balance: Rs. {account.get_balance():.2f}")
-
-
-def _execute_transaction(
-    account: BankAccount, 
-    transaction_type: str, 
-    amount: float
-) -> bool:
-    """
-    Execute the actual transaction on the account.
-    
-    Args:
-        account: Account to transact on.
-        transaction_type: Type of transaction.
-        amount: Transaction amount.
-        
-    Returns:
-        True if successful, False otherwise.
-    """
-    if transaction_type == "deposit":
-        return account.deposit(amount)
-    elif transaction_type == "withdraw":
-        return account.withdraw(amount)
-    
-    print("❌ Unknown transaction type.")
-    return False
+            print(f"Current Balance: Rs. {account._balance_str}")
 
 
 def _handle_failed_attempt(attempt: int, reason: str) -> None:
@@ -156,7 +139,7 @@ def _handle_failed_attempt(attempt: int, reason: str) -> None:
         print("❌ Maximum attempts reached. Returning to main menu.")
 
 
-def display_all_accounts(accounts: list[BankAccount]) -> None:
+def display_all_accounts(accounts: AccountRegistry) -> None:
     """Display all registered accounts."""
     print("\n--- Account Registry ---")
     
@@ -164,40 +147,39 @@ def display_all_accounts(accounts: list[BankAccount]) -> None:
         print("No accounts found.")
         return
     
-    for account in accounts:
-        print(account)
+    # One write for the whole listing instead of one print per account
+    print("\n".join(map(str, accounts)))
 
 
-def end_of_month_process(accounts: list[BankAccount]) -> None:
+def end_of_month_process(accounts: AccountRegistry) -> None:
     """
     Apply monthly interest/charges to all accounts.
     
     Args:
-        accounts: List of all accounts to process.
+        accounts: Registry of all accounts to process.
     """
     print("\n--- End of Month Processing ---")
     
-    for account in accounts:
-        if isinstance(account, SavingsAccount):
-            account.apply_interest()
-        elif isinstance(account, CreditAccount):
-            account.apply_debt_interest()
+    with frozen_timestamp(), quiet_output():
+        for account_type, group in accounts.by_type().items():
+            account_type.bulk_apply_monthly(group)
 
-    save_master_data(accounts)
-    print("✅ All accounts updated and saved.")
+    accounts.mark_dirty()
+    emit(
+        f"📊 Monthly interest and charges processed for {len(accounts)} account(s).",
+        "✅ All accounts updated."
+    )
 
 
-def transfer_money(accounts: list[BankAccount]) -> None:
+def transfer_money(accounts: AccountRegistry) -> None:
     """
     Transfer money from one account to another.
     
     Args:
-        accounts: List of all accounts.
+        accounts: Registry of all accounts.
     """
-    print("\n--- Money Transfer ---")
-    
     # Get source account
-    print("From Account:")
+    emit("\n--- Money Transfer ---", "From Account:")
     from_account = find_account(accounts)
     if from_account is None:
         return
@@ -213,8 +195,7 @@ def transfer_money(accounts: list[BankAccount]) -> None:
         print("❌ Cannot transfer to the same account.")
         return
     
-    print(f"\nFrom: {from_account}")
-    print(f"To: {to_account}")
+    emit(f"\nFrom: {from_account}", f"To: {to_account}")
     
     # Get transfer amount
     amount = get_valid_input("\nEnter amount to transfer: ", float)
@@ -228,14 +209,8 @@ def transfer_money(accounts: list[BankAccount]) -> None:
     # Perform transfer
     print(f"\nProcessing transfer of Rs. {amount:.2f}...")
     
-    # Withdraw from source (skip fee for transfers)
-    # For SavingsAccount, use skip_fee=True; other accounts ignore this parameter
-    if isinstance(from_account, SavingsAccount):
-        success = from_account.withdraw(amount, skip_fee=True)
-    else:
-        success = from_account.withdraw(amount)
-    
-    if not success:
+    # Withdraw from source (each account type decides how transfers are charged)
+    if not from_account.withdraw_for_transfer(amount):
         print("❌ Transfer failed. Withdrawal unsuccessful.")
         return
     
@@ -244,7 +219,8 @@ def transfer_money(accounts: list[BankAccount]) -> None:
         print("❌ Transfer failed. Deposit unsuccessful.")
         # Rollback: return money to source account
         from_account.deposit(amount)
+        accounts.mark_dirty(from_account)
         return
     
     print(f"✅ Transfer successful! Rs. {amount:.2f} transferred.")
-    save_master_data(accounts)
+    accounts.mark_dirty(from_account, to_account)
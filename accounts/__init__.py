@@ -7,18 +7,37 @@ Classes:
     BankAccount: Abstract base class for all account types.
     SavingsAccount: Savings account with interest.
     CreditAccount: Credit account with credit limit.
+    AccountRegistry: Collection of accounts indexed by account number.
+
+Functions:
+    quiet_output: Suppress per-transaction console messages in a block.
+    flush_transaction_logs: Write buffered transaction rows to disk.
+    frozen_timestamp: Share one log timestamp across a batch of rows.
+    read_transaction_history: Read an account's rows from the journal.
+    write_all: Write a whole buffer to a raw file descriptor.
 """
 
-from .base_account import BankAccount
+from .base_account import BankAccount, quiet_output
 from .savings_account import SavingsAccount
 from .credit_account import CreditAccount
+from .registry import AccountRegistry
+from .transaction_log import (
+    flush_transaction_logs,
+    frozen_timestamp,
+    read_transaction_history,
+    write_all
+)
 from .constants import (
     DB_ROOT,
     MASTER_FILE,
+    MASTER_JOURNAL_FILE,
     RECORDS_ROOT,
     SAVING_DIR,
     CREDIT_DIR,
+    JOURNAL_FILE,
+    O_BINARY,
     TRANSACTION_HEADERS,
+    JOURNAL_HEADERS,
     DATE_FORMAT,
     TIME_FORMAT,
     CURRENCY_PRECISION,
@@ -26,6 +45,7 @@ from .constants import (
     MAX_TRANSACTION_ATTEMPTS,
     MIN_SAVINGS_DEPOSIT,
     MIN_CREDIT_DEPOSIT,
+    MASTER_CHECKPOINT_INTERVAL,
     MASTER_HEADERS,
     ACCOUNT_TYPE_SAVINGS,
     ACCOUNT_TYPE_CREDIT
@@ -35,12 +55,22 @@ __all__ = [
     "BankAccount",
     "SavingsAccount",
     "CreditAccount",
+    "AccountRegistry",
+    "quiet_output",
+    "flush_transaction_logs",
+    "frozen_timestamp",
+    "read_transaction_history",
+    "write_all",
     "DB_ROOT",
     "MASTER_FILE",
+    "MASTER_JOURNAL_FILE",
     "RECORDS_ROOT",
     "SAVING_DIR",
     "CREDIT_DIR",
+    "JOURNAL_FILE",
+    "O_BINARY",
     "TRANSACTION_HEADERS",
+    "JOURNAL_HEADERS",
     "DATE_FORMAT",
     "TIME_FORMAT",
     "CURRENCY_PRECISION",
@@ -48,6 +78,7 @@ __all__ = [
     "MAX_TRANSACTION_ATTEMPTS",
     "MIN_SAVINGS_DEPOSIT",
     "MIN_CREDIT_DEPOSIT",
+    "MASTER_CHECKPOINT_INTERVAL",
     "MASTER_HEADERS",
     "ACCOUNT_TYPE_SAVINGS",
     "ACCOUNT_TYPE_CREDIT"
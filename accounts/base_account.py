@@ -1,16 +1,33 @@
-import csv
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from typing import ClassVar
 
-from .constants import (
-    RECORDS_ROOT,
-    TRANSACTION_HEADERS,
-    DATE_FORMAT,
-    TIME_FORMAT,
-    CURRENCY_PRECISION
-)
+from .constants import CURRENCY_PRECISION
+from .transaction_log import log_row, current_timestamp
+
+# Balances are held as integer cents; these convert at the I/O boundaries
+_CENTS = 10 ** CURRENCY_PRECISION
+_FRACTION_FMT = f"0{CURRENCY_PRECISION}d"
+
+# Holder names are written to the master file without CSV quoting, so the
+# characters that would need it are replaced once when an account is made
+_HOLDER_NAME_TABLE = str.maketrans({",": " ", '"': "'", "\r": " ", "\n": " "})
+
+# When set, account operations skip their per-transaction console messages
+_QUIET: ContextVar[bool] = ContextVar("quiet", default=False)
+
+
+@contextmanager
+def quiet_output() -> Iterator[None]:
+    """Suppress account console messages for the duration of the block."""
+    token = _QUIET.set(True)
+    try:
+        yield
+    finally:
+        _QUIET.reset(token)
 
 
 class BankAccount(ABC):
@@ -20,42 +37,50 @@ class BankAccount(ABC):
     Manages account numbers, balance, and transaction logging.
     Each subclass maintains its own account number sequence.
     
+    The balance is stored as an integer number of cents; amounts are
+    accepted as floats and converted once with _to_cents().
+    
     Attributes:
         holder_name: Name of the account holder.
-        account_number: Unique account identifier.
-        record_folder: Subdirectory for transaction records.
+        account_number: Identifier, unique within the account type.
     """
     
-    # Subclasses must define their own starting number
+    __slots__ = (
+        "holder_name",
+        "_balance",
+        "_balance_str",
+        "account_number"
+    )
+
+    # Subclasses must define their own starting number and type code
     _next_account_number: ClassVar[int]
     _account_number_prefix: ClassVar[int]  # Starting prefix for the account type
+    TYPE_CODE: ClassVar[str]  # Account type identifier in the master file
 
     def __init__(
         self,
         holder_name: str,
         initial_balance: float = 0.00,
-        account_number: int | None = None,
-        record_folder: str = "general"
+        account_number: int | None = None
     ) -> None:
         """
         Initialize a new bank account.
         
         Args:
-            holder_name: Name of the account holder.
+            holder_name: Name of the account holder; commas, double quotes
+                and line breaks are replaced.
             initial_balance: Starting balance (default: 0.00).
             account_number: Existing account number for loading (optional).
-            record_folder: Subdirectory name for transaction records.
         """
-        self.holder_name = holder_name
-        self._balance = float(initial_balance)
-        self.record_folder = record_folder
+        self.holder_name = holder_name.translate(_HOLDER_NAME_TABLE)
+        self._set_balance(self._to_cents(initial_balance))
 
         if account_number is not None:
             self.account_number = int(account_number)
             self._update_next_account_number()
         else:
             self.account_number = self._generate_account_number()
-            self._log_transaction("Account Created", initial_balance)
+            self._log_transaction("Account Created", self._balance)
 
     @classmethod
     def _generate_account_number(cls) -> int:
@@ -64,39 +89,85 @@ class BankAccount(ABC):
         cls._next_account_number += 1
         return account_number
 
+    def _restore(
+        self,
+        holder_name: str,
+        balance: float,
+        account_number: int
+    ) -> None:
+        """
+        Set the common fields of a saved account created without __init__.
+        
+        Values are trusted as already parsed, and neither the account number
+        counter nor the transaction journal is touched.
+        """
+        self.holder_name = holder_name.translate(_HOLDER_NAME_TABLE)
+        self.account_number = account_number
+        self._set_balance(self._to_cents(balance))
+
+    @classmethod
+    def update_account_counter(cls, account_numbers: Iterable[int]) -> None:
+        """
+        Advance the account number counter past a batch of loaded accounts.
+        
+        Args:
+            account_numbers: Numbers of the accounts that were loaded.
+        """
+        highest = max(account_numbers, default=None)
+        if highest is not None and highest >= cls._next_account_number:
+            cls._next_account_number = highest + 1
+
     def _update_next_account_number(self) -> None:
         """Update the class counter if loaded account number is higher."""
-        if self.account_number >= type(self)._next_account_number:
-            type(self)._next_account_number = self.account_number + 1
+        cls = type(self)
+        if self.account_number >= cls._next_account_number:
+            cls._next_account_number = self.account_number + 1
+
+    @staticmethod
+    def _notify(message: str) -> None:
+        """Print a console message unless inside quiet_output()."""
+        if not _QUIET.get():
+            print(message)
 
-    def _log_transaction(self, transaction_type: str, amount: float) -> None:
+    def _log_transaction(self, transaction_type: str, amount: int) -> None:
         """
-        Record a transaction to the account's CSV log file.
+        Record a transaction in the transaction journal.
+        
+        Rows are buffered and written in batches; call
+        flush_transaction_logs() to force them to disk.
         
         Args:
             transaction_type: Description of the transaction.
-            amount: Transaction amount (positive or negative).
+            amount: Transaction amount in cents (positive or negative).
         """
-        folder_path = RECORDS_ROOT / self.record_folder
-        folder_path.mkdir(parents=True, exist_ok=True)
-
-        file_path = folder_path / f"acc_{self.account_number}.csv"
-        file_exists = file_path.is_file()
+        log_row(*self._transaction_entry(transaction_type, amount))
 
-        with open(file_path, "a", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
+    def _transaction_entry(
+        self,
+        transaction_type: str,
+        amount: int
+    ) -> tuple[str, int, list[str]]:
+        """
+        Build the journal entry for a transaction at the current balance.
+        
+        Journal rows are joined without CSV quoting, so transaction_type
+        must not contain commas, double quotes or line breaks.
+        
+        Args:
+            transaction_type: Description of the transaction.
+            amount: Transaction amount in cents (positive or negative).
             
-            if not file_exists:
-                writer.writerow(TRANSACTION_HEADERS)
-
-            now = datetime.now()
-            writer.writerow([
-                now.strftime(DATE_FORMAT),
-                now.strftime(TIME_FORMAT),
-                transaction_type,
-                f"{amount:.{CURRENCY_PRECISION}f}",
-                f"{self._balance:.{CURRENCY_PRECISION}f}"
-            ])
+        Returns:
+            Tuple of (account type, account number, formatted row).
+        """
+        date_str, time_str = current_timestamp()
+        return self.TYPE_CODE, self.account_number, [
+            date_str,
+            time_str,
+            transaction_type,
+            self._format_cents(amount),
+            self._balance_str
+        ]
 
     def deposit(self, amount: float) -> bool:
         """
@@ -108,13 +179,14 @@ class BankAccount(ABC):
         Returns:
             True if deposit was successful, False otherwise.
         """
-        if amount <= 0:
-            print("❌ Invalid deposit amount.")
+        cents = self._to_cents(amount)
+        if cents <= 0:
+            self._notify("❌ Invalid deposit amount.")
             return False
 
-        self._balance += amount
-        print(f"✅ Deposited Rs. {amount:.2f}. New Balance: Rs. {self._balance:.2f}")
-        self._log_transaction("Deposit", amount)
+        self._set_balance(self._balance + cents)
+        self._notify(f"✅ Deposited Rs. {amount:.2f}. New Balance: Rs. {self._balance_str}")
+        self._log_transaction("Deposit", cents)
         return True
 
     def withdraw(self, amount: float) -> bool:
@@ -127,32 +199,86 @@ class BankAccount(ABC):
         Returns:
             True if withdrawal was successful, False otherwise.
         """
-        if amount <= 0 or amount > self._balance:
-            print("❌ Insufficient funds or invalid amount.")
+        cents = self._to_cents(amount)
+        if cents <= 0 or cents > self._balance:
+            self._notify("❌ Insufficient funds or invalid amount.")
             return False
 
-        self._balance -= amount
-        print(f"✅ Withdrew Rs. {amount:.2f}. New Balance: Rs. {self._balance:.2f}")
-        self._log_transaction("Withdrawal", -amount)
+        self._set_balance(self._balance - cents)
+        self._notify(f"✅ Withdrew Rs. {amount:.2f}. New Balance: Rs. {self._balance_str}")
+        self._log_transaction("Withdrawal", -cents)
         return True
 
+    @abstractmethod
+    def apply_monthly(self) -> None:
+        """Apply this account type's month-end interest or charges."""
+
+    @classmethod
+    def bulk_apply_monthly(cls, accounts: Sequence["BankAccount"]) -> None:
+        """
+        Apply month-end processing to many accounts of this type.
+        
+        Subclasses may override this with a batched implementation;
+        the default calls apply_monthly() on each account.
+        
+        Args:
+            accounts: Accounts of this type to process.
+        """
+        for account in accounts:
+            account.apply_monthly()
+
+    def withdraw_for_transfer(self, amount: float) -> bool:
+        """
+        Withdraw money that is being transferred to another account.
+        
+        Args:
+            amount: Amount to transfer out.
+            
+        Returns:
+            True if withdrawal was successful, False otherwise.
+        """
+        return self.withdraw(amount)
+
     def get_balance(self) -> float:
         """Get the current account balance (legacy method)."""
-        return self._balance
+        return self._from_cents(self._balance)
 
-    def _set_balance(self, new_balance: float) -> None:
-        """Set a new balance (for internal use only)."""
+    def _set_balance(self, new_balance: int) -> None:
+        """
+        Set a new balance in cents (for internal use only).
+        
+        All balance changes go through here so the cached display string
+        never goes stale.
+        """
         self._balance = new_balance
+        self._balance_str = self._format_cents(new_balance)
+
+    @staticmethod
+    def _to_cents(amount: float) -> int:
+        """Convert an amount in rupees to whole cents."""
+        return round(amount * _CENTS)
+
+    @staticmethod
+    def _from_cents(cents: int) -> float:
+        """Convert whole cents to an amount in rupees."""
+        return cents / _CENTS
+
+    @staticmethod
+    def _format_cents(cents: int) -> str:
+        """Format an amount in cents as rupees, e.g. -1205 as "-12.05"."""
+        whole, fraction = divmod(abs(cents), _CENTS)
+        sign = "-" if cents < 0 else ""
+        return f"{sign}{whole}.{fraction:{_FRACTION_FMT}}"
 
     def __str__(self) -> str:
         """Return a string representation of the account."""
-        return f"[Acc: {self.account_number}] {self.holder_name} : Rs. {self._balance:.2f}"
+        return f"[Acc: {self.account_number}] {self.holder_name} : Rs. {self._balance_str}"
 
     def __repr__(self) -> str:
         """Return a detailed string representation for debugging."""
         return (
             f"{self.__class__.__name__}("
             f"holder_name={self.holder_name!r}, "
-            f"balance={self._balance:.2f}, "
+            f"balance={self._balance_str}, "
             f"account_number={self.account_number})"
         )
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Final
 
@@ -6,9 +7,14 @@ from typing import Final
 # =============================================================================
 DB_ROOT: Final[str] = "database"
 MASTER_FILE: Final[Path] = Path(DB_ROOT) / "banking_master.csv"
+MASTER_JOURNAL_FILE: Final[Path] = Path(DB_ROOT) / "banking_master.wal"
 RECORDS_ROOT: Final[Path] = Path(DB_ROOT) / "records"
 SAVING_DIR: Final[Path] = RECORDS_ROOT / "saving"
 CREDIT_DIR: Final[Path] = RECORDS_ROOT / "credit"
+JOURNAL_FILE: Final[Path] = RECORDS_ROOT / "journal.csv"
+
+# Extra flag for raw file descriptors; keeps Windows from translating line endings
+O_BINARY: Final[int] = getattr(os, "O_BINARY", 0)
 
 # =============================================================================
 # Transaction Log Configuration
@@ -16,6 +22,7 @@ CREDIT_DIR: Final[Path] = RECORDS_ROOT / "credit"
 TRANSACTION_HEADERS: Final[tuple[str, ...]] = (
     "Date", "Time", "Transaction", "Amount", "New Balance"
 )
+JOURNAL_HEADERS: Final[tuple[str, ...]] = ("Type", "AccNum", *TRANSACTION_HEADERS)
 
 # =============================================================================
 # Date/Time Formats
@@ -39,6 +46,9 @@ MAX_TRANSACTION_ATTEMPTS: Final[int] = 3
 MIN_SAVINGS_DEPOSIT: Final[float] = 500.00
 MIN_CREDIT_DEPOSIT: Final[float] = 5000.00
 
+# Master journal rows appended before the master file is rewritten
+MASTER_CHECKPOINT_INTERVAL: Final[int] = 100
+
 # Master file headers
 MASTER_HEADERS: Final[tuple[str, ...]] = (
     "Type", "AccNum", "Name", "CurrentBalance", "Rate_Limit", "MinBal_Fee"
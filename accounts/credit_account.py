@@ -1,6 +1,9 @@
+from collections.abc import Sequence
 from typing import ClassVar
 
 from .base_account import BankAccount
+from .constants import ACCOUNT_TYPE_CREDIT
+from .transaction_log import log_rows
 
 
 class CreditAccount(BankAccount):
@@ -15,9 +18,18 @@ class CreditAccount(BankAccount):
         cash_advance_fee: Percentage fee for cash withdrawals.
     """
     
+    __slots__ = (
+        "_credit_limit",
+        "_debt_interest_rate",
+        "_monthly_debt_rate",
+        "cash_advance_fee",
+        "_available_credit"
+    )
+
     # Account number sequence for Credit accounts (starts at 1900)
     _account_number_prefix: ClassVar[int] = 1900
     _next_account_number: ClassVar[int] = 1900
+    TYPE_CODE: ClassVar[str] = ACCOUNT_TYPE_CREDIT
     
     # Class-level constants
     MIN_CASH_ADVANCE_AMOUNT: ClassVar[float] = 500.00
@@ -46,10 +58,41 @@ class CreditAccount(BankAccount):
             debt_interest_rate: Annual interest rate on debt.
             cash_advance_fee: Fee percentage for cash advances.
         """
-        super().__init__(holder_name, initial_balance, account_number, record_folder="credit")
-        self.credit_limit = float(credit_limit)
-        self.debt_interest_rate = float(debt_interest_rate)
+        self._credit_limit = float(credit_limit)
+        self.debt_interest_rate = debt_interest_rate
         self.cash_advance_fee = float(cash_advance_fee)
+        super().__init__(holder_name, initial_balance, account_number)
+
+    @classmethod
+    def from_saved(
+        cls,
+        account_number: int,
+        holder_name: str,
+        balance: float,
+        credit_limit: float
+    ) -> "CreditAccount":
+        """
+        Rebuild a saved credit account without running __init__.
+        
+        Intended for bulk loading: arguments must already be parsed, and
+        the caller advances the account number counter once afterwards
+        with update_account_counter().
+        
+        Args:
+            account_number: Saved account number.
+            holder_name: Name of the account holder.
+            balance: Saved balance.
+            credit_limit: Maximum credit limit.
+            
+        Returns:
+            The restored account.
+        """
+        account = cls.__new__(cls)
+        account._credit_limit = credit_limit
+        account.debt_interest_rate = cls.DEFAULT_DEBT_INTEREST_RATE
+        account.cash_advance_fee = cls.DEFAULT_CASH_ADVANCE_FEE
+        account._restore(holder_name, balance, account_number)
+        return account
 
     def withdraw(self, amount: float) -> bool:
         """
@@ -63,44 +106,99 @@ class CreditAccount(BankAccount):
         """
         # Check minimum cash advance amount
         if amount < self.MIN_CASH_ADVANCE_AMOUNT:
-            print(f"❌ Transaction Failed! Minimum Cash Advance amount is Rs. {self.MIN_CASH_ADVANCE_AMOUNT:.2f}")
+            self._notify(f"❌ Transaction Failed! Minimum Cash Advance amount is Rs. {self.MIN_CASH_ADVANCE_AMOUNT:.2f}")
             return False
 
-        fee = amount * self.cash_advance_fee
-        total_cost = amount + fee
+        cents = self._to_cents(amount)
+        fee = round(cents * self.cash_advance_fee)
+        total_cost = cents + fee
 
         # Check credit limit
-        if (self._balance - total_cost) < -self.credit_limit:
-            print(f"❌ Limit Exceeded. Available Credit: Rs. {self.available_credit:.2f}")
+        if total_cost > self._available_credit:
+            self._notify(f"❌ Limit Exceeded. Available Credit: Rs. {self._format_cents(self._available_credit)}")
             return False
 
-        # Process withdrawal
-        self._balance -= amount
-        self._log_transaction("Withdrawal", -amount)
-
-        # Apply cash advance fee
-        self._balance -= fee
-        self._log_transaction("Cash Advance Fee", -fee)
+        # Process withdrawal and cash advance fee as a single log entry
+        fee_str = self._format_cents(fee)
+        self._set_balance(self._balance - total_cost)
+        self._log_transaction(f"Withdrawal (+Fee Rs. {fee_str})", -total_cost)
 
-        print(f"✅ Withdrew Rs. {amount:.2f} (Fee: Rs. {fee:.2f}). New Balance: Rs. {self._balance:.2f}")
+        self._notify(f"✅ Withdrew Rs. {amount:.2f} (Fee: Rs. {fee_str}). New Balance: Rs. {self._balance_str}")
         return True
 
+    def apply_monthly(self) -> None:
+        """Apply the monthly debt interest."""
+        self.apply_debt_interest()
+
+    @classmethod
+    def bulk_apply_monthly(cls, accounts: Sequence["CreditAccount"]) -> None:
+        """Apply the monthly debt interest to many credit accounts."""
+        cls.bulk_apply_debt_interest(accounts)
+
     def apply_debt_interest(self) -> None:
         """Apply monthly interest on outstanding debt (negative balance)."""
-        if self._balance >= 0:
-            return
+        self.bulk_apply_debt_interest([self])
 
-        monthly_rate = self.debt_interest_rate / self.MONTHS_PER_YEAR
-        interest_amount = abs(self._balance) * monthly_rate
+    @classmethod
+    def bulk_apply_debt_interest(cls, accounts: Sequence["CreditAccount"]) -> None:
+        """
+        Apply monthly debt interest to many credit accounts in one pass.
         
-        self._balance -= interest_amount
-        print(f"📉 Debt Interest Charged: Rs. {interest_amount:.2f}")
-        self._log_transaction("Debt Interest Charge", -interest_amount)
+        Accounts without outstanding debt are left untouched. All interest
+        amounts are computed up front and the resulting log rows are
+        queued with a single call.
+        
+        Args:
+            accounts: Credit accounts to charge.
+        """
+        # Debt is the negated balance clamped at zero, so accounts in credit
+        # get a zero charge without a per-account branch
+        interest_amounts = [
+            round(max(-account._balance, 0) * account._monthly_debt_rate)
+            for account in accounts
+        ]
+
+        entries = []
+        for account, interest_amount in zip(accounts, interest_amounts):
+            if not interest_amount:
+                continue
+            account._set_balance(account._balance - interest_amount)
+            entries.append(account._transaction_entry("Debt Interest Charge", -interest_amount))
+            cls._notify(f"📉 Debt Interest Charged to Acc {account.account_number}: Rs. {cls._format_cents(interest_amount)}")
+
+        log_rows(entries)
+
+    def _set_balance(self, new_balance: int) -> None:
+        """Set a new balance in cents and refresh the cached available credit."""
+        super()._set_balance(new_balance)
+        self._available_credit = self._to_cents(self._credit_limit) + new_balance
+
+    @property
+    def credit_limit(self) -> float:
+        """Get the maximum credit limit."""
+        return self._credit_limit
+
+    @credit_limit.setter
+    def credit_limit(self, value: float) -> None:
+        """Set the credit limit and refresh the cached available credit."""
+        self._credit_limit = float(value)
+        self._available_credit = self._to_cents(self._credit_limit) + self._balance
+
+    @property
+    def debt_interest_rate(self) -> float:
+        """Get the annual interest rate on debt."""
+        return self._debt_interest_rate
+
+    @debt_interest_rate.setter
+    def debt_interest_rate(self, value: float) -> None:
+        """Set the annual debt interest rate and precompute the monthly rate."""
+        self._debt_interest_rate = float(value)
+        self._monthly_debt_rate = self._debt_interest_rate / self.MONTHS_PER_YEAR
 
     @property
     def available_credit(self) -> float:
-        """Get the remaining available credit."""
-        return self.credit_limit + self._balance
+        """Get the remaining available credit (cached on every balance change)."""
+        return self._from_cents(self._available_credit)
 
     def get_available_credit(self) -> float:
         """Get available credit (legacy method)."""
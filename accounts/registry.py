@@ -0,0 +1,107 @@
+from collections.abc import Iterable, Iterator
+
+from .base_account import BankAccount
+
+
+class AccountRegistry:
+    """
+    Collection of all bank accounts with lookup by account number.
+
+    Keeps accounts in insertion order for listing and saving, alongside
+    a dict index so finding an account by number is O(1) and a partition
+    by account type so per-type passes need no type checks.
+
+    Operations that change account state mark the changed accounts
+    dirty; the application persists them once when control returns to
+    the main menu.
+
+    Attributes:
+        journal_rows: Rows in the master journal since the last checkpoint.
+    """
+
+    def __init__(self, accounts: Iterable[BankAccount] = ()) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            accounts: Accounts to register initially (optional).
+        """
+        self._accounts: list[BankAccount] = []
+        self._by_number: dict[int, BankAccount] = {}
+        self._by_type: dict[type[BankAccount], list[BankAccount]] = {}
+        # Keyed by type as well as number, since the two types' numbers can overlap
+        self._changed: dict[tuple[str, int], BankAccount] = {}
+        self._all_changed = False
+        self.journal_rows = 0
+
+        for account in accounts:
+            self.append(account)
+
+    def append(self, account: BankAccount) -> None:
+        """
+        Register an account.
+
+        Args:
+            account: The account to add.
+        """
+        self._accounts.append(account)
+        # A savings and a credit account can share a number; like the old
+        # linear scan, lookups find the one registered first
+        self._by_number.setdefault(account.account_number, account)
+        self._by_type.setdefault(type(account), []).append(account)
+
+    def get(self, account_number: int) -> BankAccount | None:
+        """
+        Find an account by its number.
+
+        Args:
+            account_number: Number of the account to find.
+
+        Returns:
+            The account, or None if no account has that number.
+        """
+        return self._by_number.get(account_number)
+
+    def by_type(self) -> dict[type[BankAccount], list[BankAccount]]:
+        """Get the accounts partitioned by concrete account type."""
+        return self._by_type
+
+    @property
+    def dirty(self) -> bool:
+        """Whether account state changed since the last save."""
+        return self._all_changed or bool(self._changed)
+
+    @property
+    def all_changed(self) -> bool:
+        """Whether every account was marked dirty at once."""
+        return self._all_changed
+
+    def changed_accounts(self) -> list[BankAccount]:
+        """Get the accounts marked dirty since the last save."""
+        return list(self._changed.values())
+
+    def mark_dirty(self, *changed: BankAccount) -> None:
+        """
+        Record that account state changed and needs saving.
+
+        Args:
+            changed: The accounts that changed; if none are given,
+                every account is treated as changed.
+        """
+        if not changed:
+            self._all_changed = True
+        for account in changed:
+            self._changed[account.TYPE_CODE, account.account_number] = account
+
+    def mark_clean(self) -> None:
+        """Record that the current account state has been saved."""
+        self._changed.clear()
+        self._all_changed = False
+
+    def __iter__(self) -> Iterator[BankAccount]:
+        """Iterate over accounts in the order they were registered."""
+        return iter(self._accounts)
+
+    def __len__(self) -> int:
+        """Return the number of registered accounts."""
+        return len(self._accounts)
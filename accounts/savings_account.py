@@ -1,6 +1,9 @@
+from collections.abc import Sequence
 from typing import ClassVar
 
 from .base_account import BankAccount
+from .constants import ACCOUNT_TYPE_SAVINGS
+from .transaction_log import log_rows
 
 
 class SavingsAccount(BankAccount):
@@ -14,9 +17,12 @@ class SavingsAccount(BankAccount):
         min_balance: Minimum balance to maintain (default: Rs. 500).
     """
     
+    __slots__ = ("_interest_rate", "_monthly_rate", "min_balance")
+
     # Account number sequence for Savings accounts (starts at 1200)
     _account_number_prefix: ClassVar[int] = 1200
     _next_account_number: ClassVar[int] = 1200
+    TYPE_CODE: ClassVar[str] = ACCOUNT_TYPE_SAVINGS
     
     # Class-level constants
     MIN_WITHDRAWAL_AMOUNT: ClassVar[float] = 50.00
@@ -43,10 +49,42 @@ class SavingsAccount(BankAccount):
             interest_rate: Annual interest rate.
             min_balance: Minimum balance requirement.
         """
-        super().__init__(holder_name, initial_balance, account_number, record_folder="saving")
-        self.interest_rate = float(interest_rate)
+        super().__init__(holder_name, initial_balance, account_number)
+        self.interest_rate = interest_rate
         self.min_balance = float(min_balance)
 
+    @classmethod
+    def from_saved(
+        cls,
+        account_number: int,
+        holder_name: str,
+        balance: float,
+        interest_rate: float,
+        min_balance: float
+    ) -> "SavingsAccount":
+        """
+        Rebuild a saved savings account without running __init__.
+        
+        Intended for bulk loading: arguments must already be parsed, and
+        the caller advances the account number counter once afterwards
+        with update_account_counter().
+        
+        Args:
+            account_number: Saved account number.
+            holder_name: Name of the account holder.
+            balance: Saved balance.
+            interest_rate: Annual interest rate.
+            min_balance: Minimum balance requirement.
+            
+        Returns:
+            The restored account.
+        """
+        account = cls.__new__(cls)
+        account.interest_rate = interest_rate
+        account.min_balance = min_balance
+        account._restore(holder_name, balance, account_number)
+        return account
+
     def withdraw(self, amount: float, skip_fee: bool = False) -> bool:
         """
         Withdraw from savings with minimum amount and balance checks.
@@ -61,16 +99,16 @@ class SavingsAccount(BankAccount):
         """
         # Check minimum withdrawal amount
         if amount < self.MIN_WITHDRAWAL_AMOUNT:
-            print(f"❌ Transaction Failed! Minimum withdrawal amount is Rs. {self.MIN_WITHDRAWAL_AMOUNT:.2f}")
+            self._notify(f"❌ Transaction Failed! Minimum withdrawal amount is Rs. {self.MIN_WITHDRAWAL_AMOUNT:.2f}")
             return False
 
         # Check minimum balance maintenance (including fee if applicable)
-        fee_amount = 0 if skip_fee else self.WITHDRAWAL_FEE
-        total_deduction = amount + fee_amount
-        if (self._balance - total_deduction) < self.min_balance:
-            print(f"❌ Transaction Failed! You must maintain a minimum balance of Rs. {self.min_balance:.2f}")
+        fee = 0 if skip_fee else self._to_cents(self.WITHDRAWAL_FEE)
+        total_deduction = self._to_cents(amount) + fee
+        if (self._balance - total_deduction) < self._to_cents(self.min_balance):
+            self._notify(f"❌ Transaction Failed! You must maintain a minimum balance of Rs. {self.min_balance:.2f}")
             if not skip_fee:
-                print(f"   (Note: Rs. {self.WITHDRAWAL_FEE:.2f} withdrawal fee applies)")
+                self._notify(f"   (Note: Rs. {self.WITHDRAWAL_FEE:.2f} withdrawal fee applies)")
             return False
 
         # Perform withdrawal
@@ -78,15 +116,65 @@ class SavingsAccount(BankAccount):
         
         if success and not skip_fee:
             # Apply withdrawal fee only for regular withdrawals
-            self._balance -= self.WITHDRAWAL_FEE
-            self._log_transaction("Withdrawal Fee", -self.WITHDRAWAL_FEE)
-            print(f"💳 Withdrawal fee of Rs. {self.WITHDRAWAL_FEE:.2f} applied.")
+            self._set_balance(self._balance - fee)
+            self._log_transaction("Withdrawal Fee", -fee)
+            self._notify(f"💳 Withdrawal fee of Rs. {self.WITHDRAWAL_FEE:.2f} applied.")
         
         return success
 
+    @property
+    def interest_rate(self) -> float:
+        """Get the annual interest rate."""
+        return self._interest_rate
+
+    @interest_rate.setter
+    def interest_rate(self, value: float) -> None:
+        """Set the annual interest rate and precompute the monthly rate."""
+        self._interest_rate = float(value)
+        self._monthly_rate = self._interest_rate / self.MONTHS_PER_YEAR
+
+    def withdraw_for_transfer(self, amount: float) -> bool:
+        """Withdraw for a transfer without the withdrawal fee."""
+        return self.withdraw(amount, skip_fee=True)
+
+    def apply_monthly(self) -> None:
+        """Apply the monthly interest."""
+        self.apply_interest()
+
+    @classmethod
+    def bulk_apply_monthly(cls, accounts: Sequence["SavingsAccount"]) -> None:
+        """Apply the monthly interest to many savings accounts."""
+        cls.bulk_apply_interest(accounts)
+
     def apply_interest(self) -> None:
         """Apply monthly interest to the account balance."""
-        monthly_rate = self.interest_rate / self.MONTHS_PER_YEAR
-        interest_amount = self._balance * monthly_rate
-        self.deposit(interest_amount)
-        print("💰 Monthly Interest applied.")
+        self.bulk_apply_interest([self])
+
+    @classmethod
+    def bulk_apply_interest(cls, accounts: Sequence["SavingsAccount"]) -> None:
+        """
+        Apply monthly interest to many savings accounts in one pass.
+        
+        All interest amounts are computed up front, rounded to whole
+        cents, and the resulting log rows are queued with a single call.
+        
+        Args:
+            accounts: Savings accounts to credit.
+        """
+        interest_amounts = [
+            round(account._balance * account._monthly_rate)
+            for account in accounts
+        ]
+
+        entries = []
+        for account, interest_amount in zip(accounts, interest_amounts):
+            if interest_amount <= 0:
+                continue
+            account._set_balance(account._balance + interest_amount)
+            entries.append(account._transaction_entry("Deposit", interest_amount))
+            cls._notify(
+                f"💰 Monthly Interest applied to Acc {account.account_number}: "
+                f"Rs. {cls._format_cents(interest_amount)}. New Balance: Rs. {account._balance_str}"
+            )
+
+        log_rows(entries)
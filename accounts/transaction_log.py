@@ -0,0 +1,371 @@
+"""
+Transaction Log Module
+
+Records every account's transactions in a single append-only journal,
+keyed by account type and number since both types share one number
+range. Rows are buffered in memory and written in batches, and an in-memory
+index of row offsets allows one account's history to be read back
+without scanning the whole journal.
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import ClassVar
+
+from .constants import (
+    JOURNAL_FILE,
+    JOURNAL_HEADERS,
+    O_BINARY,
+    SAVING_DIR,
+    CREDIT_DIR,
+    ACCOUNT_TYPE_SAVINGS,
+    ACCOUNT_TYPE_CREDIT,
+    DATE_FORMAT,
+    TIME_FORMAT
+)
+
+# Account type of the rows in each legacy records/<folder> directory
+_LEGACY_FOLDER_TYPES = {
+    SAVING_DIR.name: ACCOUNT_TYPE_SAVINGS,
+    CREDIT_DIR.name: ACCOUNT_TYPE_CREDIT
+}
+
+
+# Commas in a complete journal line; rows never need CSV quoting
+_JOURNAL_SEPARATORS = len(JOURNAL_HEADERS) - 1
+
+
+def write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a raw file descriptor, retrying after partial writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+class _LogBuffer:
+    """
+    In-memory write buffer for the transaction journal.
+
+    Rows are queued and encoded in a batch once FLUSH_ROW_COUNT rows are
+    pending. Encoded bytes are only written up to the last whole
+    BLOCK_SIZE boundary of the journal, so automatic writes fill whole
+    disk blocks; the remainder is written once FLUSH_INTERVAL seconds
+    have passed since the last flush, or on an explicit flush. A block
+    boundary usually falls inside a row, so between those writes the
+    journal ends with a partial row. A crash at that point loses the
+    partial row along with the unwritten ones, since the torn row is cut
+    off when the journal is reopened. The
+    journal is opened once as a raw file descriptor and each batch is
+    written with a single os.write() call, bypassing Python's buffered
+    file objects. All operations hold a lock so rows
+    queued from several threads are committed together and in order.
+
+    When the journal is first created, rows from the legacy per-account
+    files (records/<folder>/acc_<num>.csv) are merged into it.
+    """
+
+    FLUSH_ROW_COUNT: ClassVar[int] = 32
+    FLUSH_INTERVAL: ClassVar[float] = 1.0
+    BLOCK_SIZE: ClassVar[int] = 4096
+    MIGRATION_WORKERS: ClassVar[int] = 8
+    OPEN_FLAGS: ClassVar[int] = (
+        os.O_WRONLY | os.O_APPEND | os.O_CREAT | O_BINARY
+    )
+
+    def __init__(self, journal_path: Path) -> None:
+        self._path = journal_path
+        self._fd: int | None = None
+        self._pending: list[tuple[str, int, list[str]]] = []
+        self._staged = bytearray()
+        self._index: dict[tuple[str, int], list[int]] = {}
+        self._offset = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+
+    def append(self, account_type: str, account_number: int, row: list[str]) -> None:
+        """
+        Queue a row for the journal, flushing if a threshold is hit.
+        
+        Args:
+            account_type: Type code of the account.
+            account_number: Account the transaction belongs to.
+            row: Pre-formatted transaction row.
+        """
+        with self._lock:
+            self._pending.append((account_type, account_number, row))
+            self._check_flush()
+
+    def extend(self, entries: Iterable[tuple[str, int, list[str]]]) -> None:
+        """
+        Queue many (account type, account number, row) entries at once.
+        
+        Args:
+            entries: Journal entries to append, in order.
+        """
+        with self._lock:
+            self._pending.extend(entries)
+            self._check_flush()
+
+    def _check_flush(self) -> None:
+        """Flush on the time threshold, or write whole blocks on the row threshold."""
+        if time.monotonic() - self._last_flush > self.FLUSH_INTERVAL:
+            self.flush()
+        elif len(self._pending) >= self.FLUSH_ROW_COUNT:
+            self._flush_blocks()
+
+    def flush(self) -> None:
+        """Write all pending rows to the journal."""
+        with self._lock:
+            if self._pending or self._staged:
+                fd = self._stage_pending()
+                write_all(fd, self._staged)
+                self._staged.clear()
+
+            self._last_flush = time.monotonic()
+
+    def _flush_blocks(self) -> None:
+        """Write staged bytes up to the last whole block boundary of the journal."""
+        fd = self._stage_pending()
+        file_end = self._offset - len(self._staged)
+        size = self._offset // self.BLOCK_SIZE * self.BLOCK_SIZE - file_end
+
+        if size > 0:
+            write_all(fd, self._staged[:size])
+            del self._staged[:size]
+
+    def _stage_pending(self) -> int:
+        """Encode pending rows into the staging buffer, opening the journal if needed."""
+        fd = self._open() if self._fd is None else self._fd
+        for account_type, account_number, row in self._pending:
+            self._staged += self._stage(account_type, account_number, row)
+        self._pending.clear()
+        return fd
+
+    def close(self) -> None:
+        """Flush pending rows and close the journal."""
+        with self._lock:
+            self.flush()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def history(self, account_type: str, account_number: int) -> list[list[str]]:
+        """
+        Read back every journal row recorded for an account.
+        
+        Args:
+            account_type: Type code of the account.
+            account_number: Account to read the history of.
+            
+        Returns:
+            Transaction rows in the order they were recorded.
+        """
+        with self._lock:
+            self.flush()
+            if self._fd is None:
+                self._open()
+            offsets = list(self._index.get((account_type, account_number), ()))
+
+        rows: list[list[str]] = []
+        with open(self._path, "rb") as journal:
+            for offset in offsets:
+                journal.seek(offset)
+                line = journal.readline().decode("utf-8")
+                rows.append(line.rstrip("\r\n").split(",")[2:])
+        return rows
+
+    def _open(self) -> int:
+        """Open the journal for appending, creating and migrating it if new."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._path, self.OPEN_FLAGS, 0o644)
+        self._offset = os.lseek(fd, 0, os.SEEK_END)
+
+        if self._offset == 0:
+            header = self._encode(JOURNAL_HEADERS)
+            self._offset = len(header)
+            write_all(fd, header + b"".join(self._migrate_legacy_logs()))
+        else:
+            complete = self._build_index()
+            if complete < self._offset:
+                # Cut the line a crash left unfinished so new rows start on their own line
+                os.ftruncate(fd, complete)
+                self._offset = complete
+
+        self._fd = fd
+        return fd
+
+    def _build_index(self) -> int:
+        """
+        Index the row offsets of an existing journal.
+        
+        A final line without a line ending was cut short by a crash
+        mid-write; it is not indexed, and the caller cuts it from the
+        file the same way the master journal's torn tail is dropped.
+        
+        Returns:
+            Length of the journal up to the end of its last complete line.
+        """
+        offset = 0
+        with open(self._path, "rb") as journal:
+            line = journal.readline()  # Skip header row
+            offset += len(line)
+
+            for line in journal:
+                if not line.endswith(b"\n"):
+                    break
+                if line.count(b",") != _JOURNAL_SEPARATORS:
+                    offset += len(line)
+                    continue
+                account_type, account_number, _ = line.split(b",", 2)
+                try:
+                    key = (account_type.decode("utf-8"), int(account_number))
+                except ValueError:
+                    pass
+                else:
+                    self._index.setdefault(key, []).append(offset)
+                offset += len(line)
+
+        return offset
+
+    def _migrate_legacy_logs(self) -> Iterator[bytes]:
+        """
+        Yield the rows of any per-account log files left by older versions.
+        
+        The files are read on a thread pool, since reading many small files
+        is dominated by I/O waits, and staged in sorted file order.
+        """
+        log_paths = sorted(self._path.parent.glob("*/acc_*.csv"))
+        if not log_paths:
+            return
+
+        # Only needed for a one-off migration, so not imported at startup
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=self.MIGRATION_WORKERS) as pool:
+            for account_type, account_number, rows in pool.map(self._read_legacy_log, log_paths):
+                for row in rows:
+                    yield self._stage(account_type, account_number, row)
+
+    @staticmethod
+    def _read_legacy_log(log_path: Path) -> tuple[str, int, list[list[str]]]:
+        """
+        Read the rows of one legacy per-account log file.
+        
+        Args:
+            log_path: Path of the records/<folder>/acc_<num>.csv file.
+            
+        Returns:
+            Tuple of (account type, account number, rows); rows is empty
+            if the folder is not an account type's or the file name does
+            not hold an account number.
+        """
+        account_type = _LEGACY_FOLDER_TYPES.get(log_path.parent.name)
+        try:
+            account_number = int(log_path.stem.removeprefix("acc_"))
+        except ValueError:
+            account_type = None
+        if account_type is None:
+            return "", 0, []
+
+        import csv  # Only needed for a one-off migration
+
+        with open(log_path, "r", newline="", encoding="utf-8") as legacy:
+            reader = csv.reader(legacy)
+            next(reader, None)  # Skip header row
+            return account_type, account_number, [row for row in reader if row]
+
+    def _stage(self, account_type: str, account_number: int, row: list[str]) -> bytes:
+        """Encode a row for the journal and record its offset in the index."""
+        # Rows are already strings, so one f-string builds the whole line
+        line = f"{account_type},{account_number},{','.join(row)}\r\n".encode("utf-8")
+        self._index.setdefault((account_type, account_number), []).append(self._offset)
+        self._offset += len(line)
+        return line
+
+    @staticmethod
+    def _encode(fields: tuple[str, ...]) -> bytes:
+        """
+        Encode a tuple of fields as one CSV line.
+        
+        Fields are joined directly without the csv module's quoting, so
+        they must not contain commas, quotes or newlines.
+        """
+        return (",".join(fields) + "\r\n").encode("utf-8")
+
+
+_log_buffer = _LogBuffer(JOURNAL_FILE)
+
+# Per-thread cache of the last formatted timestamp and any frozen override
+_ts_cache = threading.local()
+
+
+def current_timestamp() -> tuple[str, str]:
+    """
+    Get the formatted date and time for a new log row.
+    
+    The strings are cached and only reformatted when the wall-clock
+    second changes, or not at all inside frozen_timestamp().
+    
+    Returns:
+        Tuple of (date string, time string).
+    """
+    frozen = getattr(_ts_cache, "frozen", None)
+    if frozen is not None:
+        return frozen
+
+    second = int(time.time())
+    if getattr(_ts_cache, "second", None) != second:
+        # Format the same second used as the cache key, not a fresh now()
+        now = datetime.fromtimestamp(second)
+        _ts_cache.second = second
+        _ts_cache.stamp = (now.strftime(DATE_FORMAT), now.strftime(TIME_FORMAT))
+    return _ts_cache.stamp
+
+
+@contextmanager
+def frozen_timestamp() -> Iterator[None]:
+    """Stamp every row logged inside the block with the same date and time."""
+    previous = getattr(_ts_cache, "frozen", None)
+    _ts_cache.frozen = current_timestamp()
+    try:
+        yield
+    finally:
+        _ts_cache.frozen = previous
+
+
+def log_row(account_type: str, account_number: int, row: list[str]) -> None:
+    """Queue a transaction row for an account."""
+    _log_buffer.append(account_type, account_number, row)
+
+
+def log_rows(entries: Iterable[tuple[str, int, list[str]]]) -> None:
+    """Queue a batch of (account type, account number, row) entries."""
+    _log_buffer.extend(entries)
+
+
+def flush_transaction_logs() -> None:
+    """Write all buffered transaction rows to disk."""
+    _log_buffer.flush()
+
+
+def read_transaction_history(account_type: str, account_number: int) -> list[list[str]]:
+    """
+    Get the recorded transactions of an account.
+    
+    Args:
+        account_type: Type code of the account, e.g. ACCOUNT_TYPE_SAVINGS.
+        account_number: Account to read the history of.
+        
+    Returns:
+        Rows laid out as TRANSACTION_HEADERS, oldest first.
+    """
+    return _log_buffer.history(account_type, account_number)
+
+
+atexit.register(_log_buffer.close)
@@ -3,48 +3,168 @@ Database Manager Module
 
 Handles all database operations for the banking system including
 saving and loading account data from CSV files.
+
+Changed accounts are appended to a master journal after each menu
+action; the full master file is only rewritten at checkpoints, and the
+journal is replayed on top of it when loading.
 """
 
 import csv
+import io
+import os
+from collections.abc import Callable, Iterable
 from pathlib import Path
 
 from accounts import (
+    AccountRegistry,
     BankAccount,
     SavingsAccount,
     CreditAccount,
+    flush_transaction_logs,
+    write_all,
     MASTER_FILE,
+    MASTER_JOURNAL_FILE,
+    MASTER_CHECKPOINT_INTERVAL,
     MASTER_HEADERS,
-    ACCOUNT_TYPE_SAVINGS,
-    ACCOUNT_TYPE_CREDIT
+    O_BINARY
 )
 
+# Master rows are joined by hand rather than through csv.writer; holder
+# names are sanitised by the account classes, so no field needs quoting
+_LINE_END = "\r\n"
+_HEADER_LINE = ",".join(MASTER_HEADERS) + _LINE_END
+
+# Full saves are written here first and renamed over the master file
+_MASTER_TMP_FILE = MASTER_FILE.with_name(MASTER_FILE.name + ".tmp")
+
 
-def save_master_data(accounts: list[BankAccount]) -> bool:
+def save_master_data(accounts: Iterable[BankAccount]) -> bool:
     """
     Save all account data to the master CSV file.
     
+    Buffered transaction log rows are flushed first so the logs never
+    lag behind the saved balances. The file is written to a temporary
+    path, synced and then renamed over the master file, so a crash
+    leaves either the old or the new file intact.
+    
     Args:
-        accounts: List of all bank accounts to save.
+        accounts: All bank accounts to save.
         
     Returns:
         True if save was successful, False otherwise.
     """
+    # The whole file is encoded up front and handed to the OS in one write
+    rows = [row for row in map(_account_to_row, accounts) if row]
+    data = "".join([_HEADER_LINE, *rows]).encode("utf-8")
+
     try:
-        with open(MASTER_FILE, "w", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            writer.writerow(MASTER_HEADERS)
-
-            for account in accounts:
-                row = _account_to_row(account)
-                if row:
-                    writer.writerow(row)
+        flush_transaction_logs()
+
+        fd = os.open(_MASTER_TMP_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | O_BINARY, 0o644)
+        try:
+            write_all(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        os.replace(_MASTER_TMP_FILE, MASTER_FILE)
+        _sync_directory(MASTER_FILE.parent)
         return True
     except OSError as error:
         print(f"⚠️ Error saving master data: {error}")
         return False
 
 
-def _account_to_row(account: BankAccount) -> list | None:
+def _sync_directory(directory: Path) -> None:
+    """Sync a directory so a rename inside it survives a crash (POSIX only)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def append_master_journal(accounts: AccountRegistry) -> bool:
+    """
+    Append the rows of the changed accounts to the master journal.
+    
+    Args:
+        accounts: Registry of all bank accounts.
+        
+    Returns:
+        True if append was successful, False otherwise.
+    """
+    rows = [row for row in map(_account_to_row, accounts.changed_accounts()) if row]
+
+    try:
+        flush_transaction_logs()
+
+        with open(MASTER_JOURNAL_FILE, "a", newline="", encoding="utf-8") as file:
+            file.writelines(rows)
+    except OSError as error:
+        print(f"⚠️ Error writing master journal: {error}")
+        return False
+
+    accounts.journal_rows += len(rows)
+    accounts.mark_clean()
+    return True
+
+
+def checkpoint_master_data(accounts: AccountRegistry) -> bool:
+    """
+    Rewrite the master CSV file and empty the master journal.
+    
+    Args:
+        accounts: Registry of all bank accounts.
+        
+    Returns:
+        True if there was nothing to checkpoint or the checkpoint succeeded.
+    """
+    if not accounts.dirty and not accounts.journal_rows:
+        return True
+
+    if not save_master_data(accounts):
+        return False
+
+    # The master file now holds every journaled row, so replaying a journal
+    # left behind by a failed delete would be harmless
+    try:
+        MASTER_JOURNAL_FILE.unlink(missing_ok=True)
+    except OSError as error:
+        print(f"⚠️ Error clearing master journal: {error}")
+
+    accounts.journal_rows = 0
+    accounts.mark_clean()
+    return True
+
+
+def save_if_dirty(accounts: AccountRegistry) -> bool:
+    """
+    Persist the registry only if it has unsaved changes.
+    
+    Changes to individual accounts are appended to the master journal;
+    the master file is rewritten when every account changed or the
+    journal has grown past MASTER_CHECKPOINT_INTERVAL rows.
+    
+    Args:
+        accounts: Registry of all bank accounts.
+        
+    Returns:
+        True if there was nothing to save or the save succeeded.
+    """
+    if not accounts.dirty:
+        return True
+
+    if accounts.all_changed or accounts.journal_rows >= MASTER_CHECKPOINT_INTERVAL:
+        return checkpoint_master_data(accounts)
+
+    return append_master_journal(accounts)
+
+
+def _account_to_row(account: BankAccount) -> str | None:
     """
     Convert a bank account to a CSV row.
     
@@ -52,57 +172,121 @@ def _account_to_row(account: BankAccount) -> list | None:
         account: The account to convert.
         
     Returns:
-        List representing the CSV row, or None if account type is unknown.
-    """
-    if isinstance(account, SavingsAccount):
-        return [
-            ACCOUNT_TYPE_SAVINGS,
-            account.account_number,
-            account.holder_name,
-            f"{account.get_balance():.2f}",
-            account.interest_rate,
-            account.min_balance
-        ]
-    elif isinstance(account, CreditAccount):
-        return [
-            ACCOUNT_TYPE_CREDIT,
-            account.account_number,
-            account.holder_name,
-            f"{account.get_balance():.2f}",
-            account.credit_limit,
-            "N/A"
-        ]
-    return None
-
-
-def load_master_data() -> list[BankAccount]:
-    """
-    Load all accounts from the master CSV file.
+        The CSV line including its line ending, or None if account type
+        is unknown.
+    """
+    row_builder = _ROW_BUILDERS.get(account.TYPE_CODE)
+    return row_builder(account) if row_builder else None
+
+
+# Balances reuse the account's cached string, formatted exactly from its
+# integer cents, instead of going through a float on every save
+def _savings_to_row(account: SavingsAccount) -> str:
+    """Convert a savings account to a CSV line."""
+    return (
+        f"{account.TYPE_CODE},{account.account_number},{account.holder_name},"
+        f"{account._balance_str},{account.interest_rate},{account.min_balance}"
+        f"{_LINE_END}"
+    )
+
+
+def _credit_to_row(account: CreditAccount) -> str:
+    """Convert a credit account to a CSV line."""
+    return (
+        f"{account.TYPE_CODE},{account.account_number},{account.holder_name},"
+        f"{account._balance_str},{account.credit_limit},N/A"
+        f"{_LINE_END}"
+    )
+
+
+# Row builder per account type code, so saving needs one dict lookup
+# per account instead of a chain of isinstance() checks
+_ROW_BUILDERS: dict[str, Callable[..., str]] = {
+    SavingsAccount.TYPE_CODE: _savings_to_row,
+    CreditAccount.TYPE_CODE: _credit_to_row
+}
+
+
+def load_master_data() -> AccountRegistry:
+    """
+    Load all accounts from the master CSV file and master journal.
+    
+    Journal rows replace the master row with the same account type and
+    number, or add a new account if there is none. Rows that fail to parse are
+    skipped and never replace a valid row.
     
     Returns:
-        List of loaded bank accounts.
+        Registry of loaded bank accounts.
     """
-    if not MASTER_FILE.exists():
-        return []
+    accounts = AccountRegistry()
+    loaded: dict[tuple[str, int], BankAccount] = {}
 
-    accounts: list[BankAccount] = []
-    
     try:
-        with open(MASTER_FILE, "r", encoding="utf-8") as file:
-            reader = csv.reader(file)
-            next(reader, None)  # Skip header row
+        if MASTER_FILE.exists():
+            with open(MASTER_FILE, "r", newline="", encoding="utf-8") as file:
+                reader = csv.reader(file)
+                next(reader, None)  # Skip header row
+                _merge_rows(loaded, reader)
 
-            for row in reader:
-                account = _row_to_account(row)
-                if account:
-                    accounts.append(account)
+        journal_rows = _read_master_journal()
+        _merge_rows(loaded, journal_rows)
+        accounts.journal_rows = len(journal_rows)
 
     except (ValueError, OSError) as error:
         print(f"⚠️ Error loading master file: {error}")
 
+    for account in loaded.values():
+        accounts.append(account)
+
+    # Accounts are restored without touching the counters; advance each once
+    for account_type, group in accounts.by_type().items():
+        account_type.update_account_counter(a.account_number for a in group)
+
     return accounts
 
 
+def _merge_rows(
+    loaded: dict[tuple[str, int], BankAccount],
+    rows: Iterable[list[str]]
+) -> None:
+    """
+    Parse master rows into accounts, later rows replacing earlier ones.
+    
+    Args:
+        loaded: Accounts parsed so far by (type code, account number),
+            updated in place; savings and credit numbers can overlap.
+        rows: CSV rows to parse.
+    """
+    for row in rows:
+        account = _row_to_account(row)
+        if account:
+            loaded[account.TYPE_CODE, account.account_number] = account
+
+
+def _read_master_journal() -> list[list[str]]:
+    """
+    Read the rows of the master journal.
+    
+    A final line without a line ending was cut short by a crash
+    mid-append; it is ignored and cut from the file so the next append
+    starts on a fresh line.
+    
+    Returns:
+        Journal rows in the order they were appended.
+    """
+    if not MASTER_JOURNAL_FILE.exists():
+        return []
+
+    with open(MASTER_JOURNAL_FILE, "r+b") as file:
+        data = file.read()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            file.truncate(complete)
+
+    text = data[:complete].decode("utf-8")
+    return list(csv.reader(io.StringIO(text, newline="")))
+
+
 def _row_to_account(row: list[str]) -> BankAccount | None:
     """
     Convert a CSV row to a bank account object.
@@ -113,31 +297,40 @@ def _row_to_account(row: list[str]) -> BankAccount | None:
     Returns:
         BankAccount instance or None if row is invalid.
     """
-    if not row or len(row) < 5:
+    row_parser = _ROW_PARSERS.get(row[0]) if row else None
+    if row_parser is None:
         return None
 
     try:
-        account_type = row[0]
-        account_number = int(row[1])
-        holder_name = row[2]
-        balance = float(row[3])
-
-        if account_type == ACCOUNT_TYPE_SAVINGS:
-            return SavingsAccount(
-                holder_name=holder_name,
-                initial_balance=balance,
-                account_number=account_number,
-                interest_rate=float(row[4]),
-                min_balance=float(row[5])
-            )
-        elif account_type == ACCOUNT_TYPE_CREDIT:
-            return CreditAccount(
-                holder_name=holder_name,
-                initial_balance=balance,
-                account_number=account_number,
-                credit_limit=float(row[4])
-            )
-    except (ValueError, IndexError):
-        pass
-
-    return None
+        return row_parser(row)
+    except (ValueError, IndexError, OverflowError):
+        return None
+
+
+def _savings_from_row(row: list[str]) -> SavingsAccount:
+    """Build a savings account from a master row with fixed column positions."""
+    return SavingsAccount.from_saved(
+        int(row[1]),
+        row[2],
+        float(row[3]),
+        interest_rate=float(row[4]),
+        min_balance=float(row[5])
+    )
+
+
+def _credit_from_row(row: list[str]) -> CreditAccount:
+    """Build a credit account from a master row with fixed column positions."""
+    return CreditAccount.from_saved(
+        int(row[1]),
+        row[2],
+        float(row[3]),
+        credit_limit=float(row[4])
+    )
+
+
+# Row parser per account type code, so loading needs one dict lookup per
+# row instead of comparing the type code against each account type
+_ROW_PARSERS: dict[str, Callable[[list[str]], BankAccount]] = {
+    SavingsAccount.TYPE_CODE: _savings_from_row,
+    CreditAccount.TYPE_CODE: _credit_from_row
+}
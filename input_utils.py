@@ -4,37 +4,100 @@ Input Utilities Module
 Provides input validation and helper functions for user interactions.
 """
 
+import math
+import re
+import sys
 from typing import Any
 
-from accounts import BankAccount, MAX_INPUT_ATTEMPTS
+from accounts import AccountRegistry, BankAccount, CURRENCY_PRECISION, MAX_INPUT_ATTEMPTS
+
+# Float input is stored as integer cents, so it must stay finite once scaled
+_CENTS = 10 ** CURRENCY_PRECISION
+
+# Prompts only need flushing when someone is typing the answers; piped
+# input lets them batch up in the stdout buffer
+_INTERACTIVE = sys.stdin.isatty()
+
+# Plain numeric formats accepted for each input type; checking these first
+# keeps typos off the exception path and rejects "nan", "inf" and exponents
+_INPUT_FORMATS: dict[type, re.Pattern[str]] = {
+    int: re.compile(r"[+-]?\d+"),
+    float: re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)"),
+}
+
+
+def emit(*lines: str) -> None:
+    """
+    Write several lines to stdout with a single write call.
+    
+    Args:
+        lines: Lines to write, without line endings.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def read_line(prompt: str) -> str | None:
+    """
+    Display a prompt and read one line from stdin.
+    
+    Args:
+        prompt: Input prompt to display.
+        
+    Returns:
+        The line without its line ending, or None if input has ended.
+    """
+    sys.stdout.write(prompt)
+    if _INTERACTIVE:
+        sys.stdout.flush()
+
+    line = sys.stdin.readline()
+    if not line:
+        return None
+    return line.rstrip("\n")
 
 
 def get_valid_input(prompt: str, data_type: type[Any]) -> Any:
     """
     Get validated user input with retry logic.
     
+    Reads lines with read_line(), and stops retrying once the input
+    is exhausted. Input for int and float must be a plain number.
+    
     Args:
         prompt: Input prompt to display.
         data_type: Expected data type for conversion.
         
     Returns:
-        Converted value or None if all attempts fail.
+        Converted value or None if all attempts fail or input ends.
     """
+    input_format = _INPUT_FORMATS.get(data_type)
+
     for _ in range(MAX_INPUT_ATTEMPTS):
-        try:
-            user_input = input(prompt)
-            return data_type(user_input)
-        except ValueError:
-            print("⚠️ Invalid format!")
+        user_input = read_line(prompt)
+        if user_input is None:
+            return None
+
+        user_input = user_input.strip()
+        if input_format is None or input_format.fullmatch(user_input):
+            try:
+                value = data_type(user_input)
+            except ValueError:
+                pass
+            else:
+                # Hundreds of digits still match the float format but overflow
+                # to inf, either on parsing or once amounts are scaled to cents
+                if not isinstance(value, float) or math.isfinite(value * _CENTS):
+                    return value
+        print("⚠️ Invalid format!")
     return None
 
 
-def find_account(accounts: list[BankAccount]) -> BankAccount | None:
+def find_account(accounts: AccountRegistry) -> BankAccount | None:
     """
     Find an account by account number.
     
     Args:
-        accounts: List of accounts to search.
+        accounts: Registry of accounts to search.
         
     Returns:
         Found account or None.
@@ -44,9 +107,7 @@ def find_account(accounts: list[BankAccount]) -> BankAccount | None:
     if account_number is None:
         return None
 
-    for account in accounts:
-        if account.account_number == account_number:
-            return account
-
-    print("❌ Account not found.")
-    return None
+    account = accounts.get(account_number)
+    if account is None:
+        print("❌ Account not found.")
+    return account
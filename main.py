@@ -5,16 +5,18 @@ Main entry point for the application.
 Orchestrates system initialization and the main application loop.
 """
 
+import atexit
 from pathlib import Path
 
-from accounts import DB_ROOT, RECORDS_ROOT, SAVING_DIR, CREDIT_DIR
-from database_manager import load_master_data
+from accounts import DB_ROOT, RECORDS_ROOT
+from database_manager import checkpoint_master_data, load_master_data, save_if_dirty
+from input_utils import read_line
 from ui import display_menu, handle_menu_choice
 
 
 def initialize_system() -> None:
     """Create required database directories if they don't exist."""
-    directories = [DB_ROOT, RECORDS_ROOT, SAVING_DIR, CREDIT_DIR]
+    directories = [DB_ROOT, RECORDS_ROOT]
     
     for directory in directories:
         Path(directory).mkdir(parents=True, exist_ok=True)
@@ -27,11 +29,21 @@ def main() -> None:
     
     print(f"🔄 System Loaded: {len(accounts)} accounts found.")
 
+    # Changes are saved once per menu action, and on any exit path
+    atexit.register(save_if_dirty, accounts)
+
     running = True
     while running:
         display_menu()
-        choice = input("Select: ").strip()
-        running = handle_menu_choice(choice, accounts)
+        choice = read_line("Select: ")
+        if choice is None:
+            break  # Input ended, e.g. a piped script ran out
+
+        running = handle_menu_choice(choice.strip(), accounts)
+        save_if_dirty(accounts)
+
+    # Fold the master journal into the master file on a clean exit
+    checkpoint_master_data(accounts)
 
 
 if __name__ == "__main__":
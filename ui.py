@@ -4,7 +4,11 @@ User Interface Module
 Handles menu display and user interaction flow.
 """
 
-from accounts import BankAccount
+import sys
+from collections.abc import Callable
+from functools import partial
+
+from accounts import AccountRegistry
 from account_operations import (
     create_account,
     perform_transaction,
@@ -13,47 +17,58 @@ from account_operations import (
     end_of_month_process
 )
 
+# The main menu never changes, so its text is built once at import
+_MENU_TEXT = "\n".join((
+    "\n=== 🏦 BANKING SYSTEM SIMULATOR ===",
+    "1. Open Account",
+    "2. Deposit",
+    "3. Withdraw",
+    "4. Transfer Money",
+    "5. Show All Accounts",
+    "6. Month-End Process",
+    "7. Exit"
+)) + "\n"
+
+
+def _exit_menu(accounts: AccountRegistry) -> bool:
+    """Say goodbye and stop the main loop."""
+    print("Goodbye! 👋")
+    return False
+
+
+def _invalid_option(accounts: AccountRegistry) -> None:
+    """Report a menu choice that has no action."""
+    print("Invalid option.")
+
+
+# Menu choice -> action taking the account registry, built once at import.
+# An action returns False to stop the main loop.
+_MENU_ACTIONS: dict[str, Callable[[AccountRegistry], bool | None]] = {
+    "1": create_account,
+    "2": partial(perform_transaction, transaction_type="deposit"),
+    "3": partial(perform_transaction, transaction_type="withdraw"),
+    "4": transfer_money,
+    "5": display_all_accounts,
+    "6": end_of_month_process,
+    "7": _exit_menu,
+}
+
 
 def display_menu() -> None:
     """Display the main menu options."""
-    print("\n=== 🏦 BANKING SYSTEM SIMULATOR ===")
-    print("1. Open Account")
-    print("2. Deposit")
-    print("3. Withdraw")
-    print("4. Transfer Money")
-    print("5. Show All Accounts")
-    print("6. Month-End Process")
-    print("7. Exit")
+    sys.stdout.write(_MENU_TEXT)
 
 
-def handle_menu_choice(choice: str, accounts: list[BankAccount]) -> bool:
+def handle_menu_choice(choice: str, accounts: AccountRegistry) -> bool:
     """
     Handle the user's menu selection.
     
     Args:
         choice: User's menu choice.
-        accounts: List of all accounts.
+        accounts: Registry of all accounts.
         
     Returns:
         False if user chose to exit, True otherwise.
     """
-    menu_actions = {
-        "1": lambda: create_account(accounts),
-        "2": lambda: perform_transaction(accounts, "deposit"),
-        "3": lambda: perform_transaction(accounts, "withdraw"),
-        "4": lambda: transfer_money(accounts),
-        "5": lambda: display_all_accounts(accounts),
-        "6": lambda: end_of_month_process(accounts),
-    }
-
-    if choice == "7":
-        print("Goodbye! 👋")
-        return False
-
-    action = menu_actions.get(choice)
-    if action:
-        action()
-    else:
-        print("Invalid option.")
-    
-    return True
+    action = _MENU_ACTIONS.get(choice, _invalid_option)
+    return action(accounts) is not False